@@ -20,30 +20,35 @@ def example_handler() -> dict:
 app = Starlite(route_handlers=[example_handler], on_app_init=[ConfigureApp()])
 ```
 """
-# this is because pycharm wigs out when there is a module called `exceptions`:
-# noinspection PyCompatibility
-from . import (
-    cache,
-    compression,
-    dependencies,
-    dto,
-    exceptions,
-    health,
-    logging,
-    openapi,
-    orm,
-    redis,
-    repository,
-    response,
-    sentry,
-    service,
-    settings,
-    sqlalchemy_plugin,
-    static_files,
-    worker,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .init_plugin import ConfigureApp, PluginConfig
 
+if TYPE_CHECKING:
+    # this is because pycharm wigs out when there is a module called `exceptions`:
+    # noinspection PyCompatibility
+    from . import (  # noqa: F401
+        cache,
+        compression,
+        dependencies,
+        dto,
+        exceptions,
+        health,
+        logging,
+        openapi,
+        orm,
+        redis,
+        repository,
+        response,
+        sentry,
+        service,
+        settings,
+        sqlalchemy_plugin,
+        static_files,
+        worker,
+    )
+
 __all__ = [
     "ConfigureApp",
     "PluginConfig",
@@ -68,3 +73,28 @@ __all__ = [
 ]
 
 __version__ = "0.1.7"
+
+_SUBMODULES = frozenset(name for name in __all__ if name.islower())
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import submodules on first access (PEP 562).
+
+    Importing the package only pays for the plugin entrypoint; each
+    submodule (and whatever it sets up - httpx client, redis, engine) is
+    imported when first referenced.
+
+    Args:
+        name: Name of the module attribute being accessed.
+
+    Returns:
+        The submodule named `name`.
+
+    Raises:
+        AttributeError: If `name` is not one of the package submodules.
+    """
+    if name not in _SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = import_module(f".{name}", __name__)
+    globals()[name] = module
+    return module
@@ -130,6 +130,18 @@ def provide_filter_dependencies(
     ]
 
 
+_COLLECTION_DEPENDENCIES = {
+    LIMIT_OFFSET_DEPENDENCY_KEY: Provide(provide_limit_offset_pagination),
+    UPDATED_FILTER_DEPENDENCY_KEY: Provide(provide_updated_filter),
+    CREATED_FILTER_DEPENDENCY_KEY: Provide(provide_created_filter),
+    ID_FILTER_DEPENDENCY_KEY: Provide(provide_id_filter),
+    FILTERS_DEPENDENCY_KEY: Provide(provide_filter_dependencies),
+}
+"""The `Provide` instances are identical for every application, so they are
+constructed once here rather than per `create_collection_dependencies()`
+call."""
+
+
 def create_collection_dependencies() -> dict[str, Provide]:
     """
     Creates a dictionary of provides for pagination endpoints.
@@ -138,10 +150,4 @@ def create_collection_dependencies() -> dict[str, Provide]:
     dict[str, Provide]
 
     """
-    return {
-        LIMIT_OFFSET_DEPENDENCY_KEY: Provide(provide_limit_offset_pagination),
-        UPDATED_FILTER_DEPENDENCY_KEY: Provide(provide_updated_filter),
-        CREATED_FILTER_DEPENDENCY_KEY: Provide(provide_created_filter),
-        ID_FILTER_DEPENDENCY_KEY: Provide(provide_id_filter),
-        FILTERS_DEPENDENCY_KEY: Provide(provide_filter_dependencies),
-    }
+    return dict(_COLLECTION_DEPENDENCIES)
@@ -3,24 +3,55 @@
 Returns the app settings as details if successful, otherwise a 503.
 """
 import contextlib
+from typing import Any
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
-from starlite import get
+from starlite import MediaType, Response, get
 from starlite.exceptions import ServiceUnavailableException
+from starlite.status_codes import HTTP_200_OK
 
 from . import settings
 from .repository.sqlalchemy import SQLAlchemyRepository
-from .settings import AppSettings
+
+APP_SETTINGS_PAYLOAD = settings.app.dict()
+"""App settings exported once at import - they are immutable for the life of
+the process, so there's no need to re-serialize them per request."""
+
+_APP_SETTINGS_BODY = orjson.dumps(APP_SETTINGS_PAYLOAD)
+"""The payload encoded once at import - load balancers hit this endpoint every
+few seconds, and the body never changes within a process."""
 
 
 class HealthCheckFailure(ServiceUnavailableException):
     """Raise for health check failure."""
 
+    __slots__ = ()
+
+
+class HealthResponse(Response):
+    """Response that serves the pre-encoded app settings payload."""
+
+    def render(self, content: Any) -> bytes:
+        """Return `content` as-is; it is encoded once at module import.
+
+        Args:
+            content: The pre-encoded response body.
+
+        Returns:
+            The response body, unchanged.
+        """
+        return content  # type:ignore[no-any-return]
+
 
 @get(path=settings.api.HEALTH_PATH, tags=["Misc"])
-async def health_check(db_session: AsyncSession) -> AppSettings:
+async def health_check(db_session: AsyncSession) -> Response:
     """Check database available and returns app config info."""
     with contextlib.suppress(Exception):
         if await SQLAlchemyRepository.check_health(db_session):
-            return settings.app
+            return HealthResponse(
+                content=_APP_SETTINGS_BODY,
+                media_type=MediaType.JSON,
+                status_code=HTTP_200_OK,
+            )
     raise HealthCheckFailure("DB not ready.")
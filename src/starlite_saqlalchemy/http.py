@@ -1,5 +1,5 @@
 """Async HTTP request client implementation built on `httpx`."""
-from typing import Any
+from typing import Any, NoReturn
 
 import httpx
 
@@ -7,6 +7,30 @@ import httpx
 class ClientException(Exception):
     """Base client exception."""
 
+    __slots__ = ()
+
+
+def _raise_for_status(response: httpx.Response) -> NoReturn:
+    """Out-of-line error path for `Client.request()`.
+
+    Parameters
+    ----------
+    response : httpx.Response
+        A response with a non-success status code.
+
+    Raises
+    ------
+    ClientException
+        Wraps the `httpx.HTTPStatusError` raised for `response`.
+    """
+    try:
+        response.raise_for_status()
+    except httpx.HTTPStatusError as exc:
+        raise ClientException(f"Client Error for '{exc.request.url}'") from exc
+    raise ClientException(  # pragma: no cover  (response always has a non-success status here)
+        f"Client Error for '{response.request.url}'"
+    )
+
 
 class Client:
     """Base class for HTTP clients.
@@ -18,7 +42,27 @@ class Client:
     ```
     """
 
-    _client = httpx.AsyncClient()
+    __slots__ = ()
+
+    _client: httpx.AsyncClient | None = None
+    """Shared client instance, constructed on first use - merely importing
+    this module shouldn't cost the transport/pool setup."""
+
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        """Return the shared `httpx.AsyncClient`, constructing it on first
+        use.
+
+        The instance is stored on `Client` so that all subclasses share
+        the one transport and connection pool.
+
+        Returns
+        -------
+        httpx.AsyncClient
+        """
+        if Client._client is None:
+            Client._client = httpx.AsyncClient()
+        return Client._client
 
     async def request(self, *args: Any, **kwargs: Any) -> httpx.Response:
         """Passes `*args`, `**kwargs` straight through to
@@ -44,12 +88,13 @@ class Client:
             Wraps any `httpx.HTTPError` arising from the request or response status check.
         """
         try:
-            req = await self._client.request(*args, **kwargs)
-            req.raise_for_status()
+            response = await self._get_client().request(*args, **kwargs)
         except httpx.HTTPError as exc:
             url = exc.request.url
             raise ClientException(f"Client Error for '{url}'") from exc
-        return req
+        if not response.is_success:
+            _raise_for_status(response)
+        return response
 
     def json(self, response: httpx.Response) -> Any:
         """
@@ -87,5 +132,10 @@ class Client:
 
     @classmethod
     async def close(cls) -> None:
-        """Closes the underlying client transport and proxies."""
-        await cls._client.aclose()
+        """Closes the underlying client transport and proxies.
+
+        No-op if the client was never constructed, so shutdown hooks
+        don't create a client just to close it.
+        """
+        if Client._client is not None:
+            await Client._client.aclose()
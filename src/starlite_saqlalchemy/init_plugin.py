@@ -28,30 +28,15 @@ instantiation:
 
 The `PluginConfig` has switches to disable every aspect of the plugin behavior.
 """
+# imports into the `configure_*` methods are deferred until the plugin is
+# called so that importing this module doesn't pay for resources it may never
+# configure (httpx client, redis, engine, settings validation).
+# pylint: disable=import-outside-toplevel
+import asyncio
 from typing import TYPE_CHECKING
 
 from pydantic import BaseModel
 from starlite.app import DEFAULT_CACHE_CONFIG, DEFAULT_OPENAPI_CONFIG
-from starlite.plugins.sql_alchemy import SQLAlchemyPlugin
-
-from . import (
-    cache,
-    compression,
-    dependencies,
-    exceptions,
-    http,
-    logging,
-    openapi,
-    redis,
-    response,
-    sentry,
-    sqlalchemy_plugin,
-    static_files,
-)
-from .health import health_check
-from .repository.exceptions import RepositoryException
-from .service import ServiceException, make_service_callback
-from .worker import create_worker_instance
 
 if TYPE_CHECKING:
 
@@ -60,6 +45,18 @@ if TYPE_CHECKING:
     from starlite_saqlalchemy.worker import WorkerFunction
 
 
+async def _shutdown_resources() -> None:
+    """Close the HTTP client and redis connection concurrently.
+
+    They hold independent resources, so there's no ordering dependency
+    between them, and waiting on them serially only adds to shutdown
+    latency.
+    """
+    from . import http, redis
+
+    await asyncio.gather(http.Client.close(), redis.client.close(), return_exceptions=True)
+
+
 class PluginConfig(BaseModel):
     """Configure behavior of the `ConfigureApp` object.
 
@@ -177,7 +174,7 @@ class ConfigureApp:
         self.configure_static_files(app_config)
         self.configure_worker(app_config)
 
-        app_config.on_shutdown.extend([http.Client.close, redis.client.close])
+        app_config.on_shutdown.append(_shutdown_resources)
         return app_config
 
     def configure_after_exception(self, app_config: "AppConfig") -> None:
@@ -187,6 +184,8 @@ class ConfigureApp:
             app_config: The Starlite application config object.
         """
         if self.config.do_after_exception:
+            from . import exceptions
+
             if not isinstance(app_config.after_exception, list):
                 app_config.after_exception = [app_config.after_exception]
             app_config.after_exception.append(exceptions.after_exception_hook_handler)
@@ -201,6 +200,8 @@ class ConfigureApp:
             app_config: The Starlite application config object.
         """
         if self.config.do_cache and app_config.cache_config is DEFAULT_CACHE_CONFIG:
+            from . import cache
+
             app_config.cache_config = cache.config
 
     def configure_collection_dependencies(self, app_config: "AppConfig") -> None:
@@ -213,6 +214,8 @@ class ConfigureApp:
             app_config: The Starlite application config object.
         """
         if self.config.do_collection_dependencies:
+            from . import dependencies
+
             for key, value in dependencies.create_collection_dependencies().items():
                 app_config.dependencies.setdefault(key, value)
 
@@ -226,6 +229,8 @@ class ConfigureApp:
             app_config: The Starlite application config object.
         """
         if self.config.do_compression and app_config.compression_config is None:
+            from . import compression
+
             app_config.compression_config = compression.config
 
     def configure_exception_handlers(self, app_config: "AppConfig") -> None:
@@ -240,6 +245,10 @@ class ConfigureApp:
         if not self.config.do_exception_handlers:
             return
 
+        from . import exceptions
+        from .repository.exceptions import RepositoryException
+        from .service import ServiceException
+
         app_config.exception_handlers.setdefault(
             RepositoryException, exceptions.repository_exception_to_http_response
         )
@@ -254,6 +263,8 @@ class ConfigureApp:
             app_config: The Starlite application config object.
         """
         if self.config.do_health_check:
+            from .health import health_check
+
             app_config.route_handlers.append(health_check)
 
     def configure_logging(self, app_config: "AppConfig") -> None:
@@ -264,6 +275,8 @@ class ConfigureApp:
             app_config: The Starlite application config object.
         """
         if self.config.do_logging and app_config.logging_config is None:
+            from . import logging
+
             app_config.logging_config = logging.config
 
     def configure_openapi(self, app_config: "AppConfig") -> None:
@@ -276,6 +289,8 @@ class ConfigureApp:
             app_config: The Starlite application config object.
         """
         if self.config.do_openapi and app_config.openapi_config is DEFAULT_OPENAPI_CONFIG:
+            from . import openapi
+
             app_config.openapi_config = openapi.config
 
     def configure_response_class(self, app_config: "AppConfig") -> None:
@@ -288,6 +303,8 @@ class ConfigureApp:
             app_config: The Starlite application config object.
         """
         if self.config.do_response_class and app_config.response_class is None:
+            from . import response
+
             app_config.response_class = response.Response
 
     def configure_sentry(self, app_config: "AppConfig") -> None:
@@ -297,6 +314,8 @@ class ConfigureApp:
             app_config: The Starlite application config object.
         """
         if self.config.do_sentry:
+            from . import sentry
+
             app_config.on_startup.append(sentry.configure)
 
     def configure_sqlalchemy_plugin(self, app_config: "AppConfig") -> None:
@@ -309,6 +328,10 @@ class ConfigureApp:
             app_config: The Starlite application config object.
         """
         if self.config.do_sqlalchemy_plugin:
+            from starlite.plugins.sql_alchemy import SQLAlchemyPlugin
+
+            from . import sqlalchemy_plugin
+
             app_config.plugins.append(SQLAlchemyPlugin(config=sqlalchemy_plugin.config))
 
     def configure_static_files(self, app_config: "AppConfig") -> None:
@@ -322,6 +345,8 @@ class ConfigureApp:
             app_config: The Starlite application config object.
         """
         if self.config.do_static_files and app_config.static_files_config is not None:
+            from . import static_files
+
             app_config.static_files_config = static_files.config
 
     def configure_worker(self, app_config: "AppConfig") -> None:
@@ -334,6 +359,9 @@ class ConfigureApp:
             app_config: The Starlite application config object.
         """
         if self.config.do_worker and self.config.worker_functions:
+            from .service import make_service_callback
+            from .worker import create_worker_instance
+
             self.config.worker_functions.append(
                 (make_service_callback.__qualname__, make_service_callback)
             )
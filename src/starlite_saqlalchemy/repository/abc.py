@@ -19,7 +19,11 @@ class AbstractRepository(Generic[T], metaclass=ABCMeta):
     """Defines the interface for interacting with the application persistent
     data."""
 
-    model_type: type[T]
+    __slots__ = ("session",)
+
+    # class-level configuration set by concrete subclasses, not an instance
+    # attribute; `ClassVar` can't carry the type variable
+    model_type: type[T]  # pylint: disable=declare-non-slot
     """Type of object represented by the repository."""
     id_attribute = "id"
     """Name of the primary identifying attribute on `model_type`."""
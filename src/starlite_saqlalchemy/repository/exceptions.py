@@ -4,11 +4,17 @@
 class RepositoryException(Exception):
     """Base repository exception type."""
 
+    __slots__ = ()
+
 
 class RepositoryConflictException(RepositoryException):
     """Exception for data integrity errors."""
 
+    __slots__ = ()
+
 
 class RepositoryNotFoundException(RepositoryException):
     """Raised when a method referencing a specific instance by identity is
     called and no instance with that identity exists."""
+
+    __slots__ = ()
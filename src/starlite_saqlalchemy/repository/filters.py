@@ -8,7 +8,7 @@ from typing import Generic, TypeVar
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(slots=True)
 class BeforeAfter:
     """Data required to filter a query on a `datetime` column."""
 
@@ -20,7 +20,7 @@ class BeforeAfter:
     """Filter results where field later than this [datetime][datetime.datetime]"""
 
 
-@dataclass
+@dataclass(slots=True)
 class CollectionFilter(Generic[T]):
     """Data required to construct a `WHERE ...
 
@@ -33,7 +33,7 @@ class CollectionFilter(Generic[T]):
     """Values for `IN` clause."""
 
 
-@dataclass
+@dataclass(slots=True)
 class LimitOffset:
     """Data required to add limit/offset filtering to a query."""
 
@@ -1,6 +1,6 @@
 """SQLAlchemy-based implementation of the repository protocol."""
-from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, Literal, TypeVar
+from functools import wraps
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, ParamSpec, TypeVar, cast
 
 from sqlalchemy import select, text
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
@@ -25,29 +25,46 @@ __all__ = [
     "ModelT",
 ]
 
+P = ParamSpec("P")
 T = TypeVar("T")
 ModelT = TypeVar("ModelT", bound="orm.Base")
 
+_HEALTH_STMT = text("SELECT 1")
+"""Health check statement, constructed once rather than per ping."""
 
-@contextmanager
-def wrap_sqlalchemy_exception() -> Any:
-    """Do something within context to raise a `RepositoryException` chained
+
+def wrap_sqlalchemy_exception(
+    fn: "abc.Callable[P, abc.Coroutine[Any, Any, T]]",
+) -> "abc.Callable[P, abc.Coroutine[Any, Any, T]]":
+    """Decorate a coroutine function to raise a `RepositoryException` chained
     from an original `SQLAlchemyError`.
 
+        >>> import asyncio
+        >>> @wrap_sqlalchemy_exception
+        ... async def db_call():
+        ...     raise SQLAlchemyError("Original Exception")
         >>> try:
-        ...     with wrap_sqlalchemy_exception():
-        ...         raise SQLAlchemyError("Original Exception")
+        ...     asyncio.run(db_call())
         ... except RepositoryException as exc:
         ...     print(f"caught repository exception from {type(exc.__context__)}")
         ...
         caught repository exception from <class 'sqlalchemy.exc.SQLAlchemyError'>
+
+    A decorator with a plain `try` block is cheaper per call than the
+    `@contextmanager` this replaces, which paid generator setup and
+    `__enter__`/`__exit__` frames on every repository operation.
     """
-    try:
-        yield
-    except IntegrityError as exc:
-        raise RepositoryConflictException from exc
-    except SQLAlchemyError as exc:
-        raise RepositoryException(f"An exception occurred: {exc}") from exc
+
+    @wraps(fn)
+    async def wrapped(*args: "P.args", **kwargs: "P.kwargs") -> T:
+        try:
+            return await fn(*args, **kwargs)
+        except IntegrityError as exc:
+            raise RepositoryConflictException from exc
+        except SQLAlchemyError as exc:
+            raise RepositoryException(f"An exception occurred: {exc}") from exc
+
+    return wrapped
 
 
 class SQLAlchemyRepository(AbstractRepository[ModelT]):
@@ -58,75 +75,103 @@ class SQLAlchemyRepository(AbstractRepository[ModelT]):
         select_: To facilitate customization of the underlying select query.
     """
 
-    model_type: type[ModelT]
+    __slots__ = ("_select",)
+
+    # class-level configuration set by concrete subclasses, not an instance
+    # attribute; `ClassVar` can't carry the type variable
+    model_type: type[ModelT]  # pylint: disable=declare-non-slot
+    _base_select: ClassVar["Select | None"] = None
+    """Base select for the repository's model type, built once per class.
+    `Select` is immutable, so sharing it between instances is safe - every
+    filter method produces a new object."""
+    _column_map: ClassVar["dict[str, Any] | None"] = None
+    # annotation-only declaration; assigned at the end of the class body
+    _filter_dispatch: ClassVar[
+        "dict[type, abc.Callable[..., None]]"
+    ]  # pylint: disable=declare-non-slot
+    """Maps filter type to its handler, saving the `isinstance` chain a
+    `match` over the filter types compiles to. Assigned at the end of the
+    class body, after the handlers are defined."""
 
     def __init__(
         self, session: "AsyncSession", select_: "Select[tuple[ModelT]] | None" = None
     ) -> None:
         super().__init__(session)
-        self._select = select(self.model_type) if select_ is None else select_
-
+        if select_ is None:
+            # read via `__dict__` - a subclass must not inherit a select built
+            # for its parent's `model_type`
+            cls = type(self)
+            select_ = cast("Select[tuple[ModelT]] | None", cls.__dict__.get("_base_select"))
+            if select_ is None:
+                select_ = cls._base_select = select(self.model_type)
+        self._select = select_
+
+    @wrap_sqlalchemy_exception
     async def add(self, data: ModelT) -> ModelT:
-        with wrap_sqlalchemy_exception():
-            instance = await self._attach_to_session(data)
-            await self.session.flush()
-            await self.session.refresh(instance)
-            self.session.expunge(instance)
-            return instance
+        instance = await self._attach_to_session(data)
+        await self.session.flush()
+        await self.session.refresh(instance)
+        self.session.expunge(instance)
+        return instance
 
+    @wrap_sqlalchemy_exception
     async def delete(self, id_: Any) -> ModelT:
-        with wrap_sqlalchemy_exception():
-            instance = await self.get(id_)
-            await self.session.delete(instance)
-            await self.session.flush()
-            self.session.expunge(instance)
-            return instance
+        instance = await self.get(id_)
+        await self.session.delete(instance)
+        await self.session.flush()
+        self.session.expunge(instance)
+        return instance
 
+    @wrap_sqlalchemy_exception
     async def get(self, id_: Any) -> ModelT:
-        with wrap_sqlalchemy_exception():
-            self._filter_select_by_kwargs(**{self.id_attribute: id_})
-            instance = (await self._execute()).scalar_one_or_none()
-            instance = self.check_not_found(instance)
-            self.session.expunge(instance)
-            return instance
+        self._filter_select_by_kwargs(**{self.id_attribute: id_})
+        instance = (await self._execute()).scalar_one_or_none()
+        instance = self.check_not_found(instance)
+        self.session.expunge(instance)
+        return instance
 
+    @wrap_sqlalchemy_exception
     async def list(self, *filters: "FilterTypes", **kwargs: Any) -> list[ModelT]:
+        dispatch = self._filter_dispatch
         for filter_ in filters:
-            match filter_:
-                case LimitOffset(limit, offset):
-                    self._apply_limit_offset_pagination(limit, offset)
-                case BeforeAfter(field_name, before, after):
-                    self._filter_on_datetime_field(field_name, before, after)
-                case CollectionFilter(field_name, values):
-                    self._filter_in_collection(field_name, values)
+            handler = dispatch.get(type(filter_))
+            if handler is None:
+                # subclass instances of the filter types dispatch to the
+                # handler for their base, as the `match` they replace did
+                for filter_type, candidate in dispatch.items():
+                    if isinstance(filter_, filter_type):
+                        handler = candidate
+                        break
+            if handler is not None:
+                handler(self, filter_)
         self._filter_select_by_kwargs(**kwargs)
 
-        with wrap_sqlalchemy_exception():
-            result = await self._execute()
-            instances = list(result.scalars())
-            for instance in instances:
-                self.session.expunge(instance)
-            return instances
+        result = await self._execute()
+        instances = list(result.scalars())
+        expunge = self.session.expunge
+        for instance in instances:
+            expunge(instance)
+        return instances
 
+    @wrap_sqlalchemy_exception
     async def update(self, data: ModelT) -> ModelT:
-        with wrap_sqlalchemy_exception():
-            id_ = self.get_id_attribute_value(data)
-            # this will raise for not found, and will put the item in the session
-            await self.get(id_)
-            # this will merge the inbound data to the instance we just put in the session
-            instance = await self._attach_to_session(data, strategy="merge")
-            await self.session.flush()
-            await self.session.refresh(instance)
-            self.session.expunge(instance)
-            return instance
-
+        id_ = self.get_id_attribute_value(data)
+        # this will raise for not found, and will put the item in the session
+        await self.get(id_)
+        # this will merge the inbound data to the instance we just put in the session
+        instance = await self._attach_to_session(data, strategy="merge")
+        await self.session.flush()
+        await self.session.refresh(instance)
+        self.session.expunge(instance)
+        return instance
+
+    @wrap_sqlalchemy_exception
     async def upsert(self, data: ModelT) -> ModelT:
-        with wrap_sqlalchemy_exception():
-            instance = await self._attach_to_session(data, strategy="merge")
-            await self.session.flush()
-            await self.session.refresh(instance)
-            self.session.expunge(instance)
-            return instance
+        instance = await self._attach_to_session(data, strategy="merge")
+        await self.session.flush()
+        await self.session.refresh(instance)
+        self.session.expunge(instance)
+        return instance
 
     @classmethod
     async def check_health(cls, session: "AsyncSession") -> bool:
@@ -139,11 +184,47 @@ class SQLAlchemyRepository(AbstractRepository[ModelT]):
             `True` if healthy.
         """
         return (  # type:ignore[no-any-return]  # pragma: no cover
-            await session.execute(text("SELECT 1"))
+            await session.execute(_HEALTH_STMT)
         ).scalar_one() == 1
 
     # the following is all sqlalchemy implementation detail, and shouldn't be directly accessed
 
+    @classmethod
+    def _model_attribute(cls, field_name: str) -> Any:
+        """Resolve `field_name` to an attribute of `model_type`.
+
+        Mapped column attributes are resolved via a map built once per
+        repository class, which saves the `InstrumentedAttribute`
+        descriptor lookup on each filter application. Anything not in
+        the map (relationships, hybrids, or any attribute of a
+        `model_type` that isn't a mapped class) falls back to
+        `getattr()`.
+
+        Args:
+            field_name: Name of the model attribute.
+
+        Returns:
+            The attribute of `model_type` named `field_name`.
+        """
+        # read via `cls.__dict__` - a subclass must not inherit a map built
+        # for its parent's `model_type`
+        column_map = cls.__dict__.get("_column_map")
+        if column_map is None:
+            mapper = getattr(cls.model_type, "__mapper__", None)
+            if mapper is None:
+                # not a mapped class - resolve everything through `getattr()`
+                column_map = {}
+            else:
+                column_map = {
+                    name: getattr(cls.model_type, name)
+                    for name in mapper.columns.keys()  # noqa: SIM118
+                }
+            cls._column_map = column_map
+        try:
+            return column_map[field_name]
+        except KeyError:
+            return getattr(cls.model_type, field_name)
+
     def _apply_limit_offset_pagination(self, limit: int, offset: int) -> None:
         self._select = self._select.limit(limit).offset(offset)
 
@@ -180,17 +261,36 @@ class SQLAlchemyRepository(AbstractRepository[ModelT]):
     def _filter_in_collection(self, field_name: str, values: "abc.Collection[Any]") -> None:
         if not values:
             return
-        self._select = self._select.where(getattr(self.model_type, field_name).in_(values))
+        self._select = self._select.where(self._model_attribute(field_name).in_(values))
 
     def _filter_on_datetime_field(
         self, field_name: str, before: "datetime | None", after: "datetime | None"
     ) -> None:
-        field = getattr(self.model_type, field_name)
+        field = self._model_attribute(field_name)
         if before is not None:
             self._select = self._select.where(field < before)
         if after is not None:
-            self._select = self._select.where(field > before)
+            self._select = self._select.where(field > after)
 
     def _filter_select_by_kwargs(self, **kwargs: Any) -> None:
-        for key, val in kwargs.items():
-            self._select = self._select.where(getattr(self.model_type, key) == val)
+        if kwargs:
+            # single `where()` call so the immutable `Select` is copied once,
+            # not once per criterion
+            self._select = self._select.where(
+                *(self._model_attribute(key) == val for key, val in kwargs.items())
+            )
+
+    def _apply_before_after(self, filter_: BeforeAfter) -> None:
+        self._filter_on_datetime_field(filter_.field_name, filter_.before, filter_.after)
+
+    def _apply_collection(self, filter_: "CollectionFilter[Any]") -> None:
+        self._filter_in_collection(filter_.field_name, filter_.values)
+
+    def _apply_limit_offset(self, filter_: LimitOffset) -> None:
+        self._apply_limit_offset_pagination(filter_.limit, filter_.offset)
+
+    _filter_dispatch = {
+        BeforeAfter: _apply_before_after,
+        CollectionFilter: _apply_collection,
+        LimitOffset: _apply_limit_offset,
+    }
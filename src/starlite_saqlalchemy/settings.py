@@ -30,6 +30,7 @@ class AppSettings(BaseSettings):
     """
 
     class Config:
+        allow_mutation = False
         case_sensitive = True
 
     BUILD_NUMBER: str
@@ -65,8 +66,9 @@ class APISettings(BaseSettings):
     """
 
     class Config:
-        env_prefix = "API_"
+        allow_mutation = False
         case_sensitive = True
+        env_prefix = "API_"
 
     CACHE_EXPIRATION: int
     DB_SESSION_DEPENDENCY_KEY: str
@@ -93,8 +95,9 @@ class OpenAPISettings(BaseSettings):
     """
 
     class Config:
-        env_prefix = "OPENAPI_"
+        allow_mutation = False
         case_sensitive = True
+        env_prefix = "OPENAPI_"
 
     TITLE: str | None
     VERSION: str
@@ -117,8 +120,9 @@ class DatabaseSettings(BaseSettings):
     """
 
     class Config:
-        env_prefix = "DB_"
+        allow_mutation = False
         case_sensitive = True
+        env_prefix = "DB_"
 
     ECHO: bool
     ECHO_POOL: bool | Literal["debug"]
@@ -142,8 +146,9 @@ class RedisSettings(BaseSettings):
     """
 
     class Config:
-        env_prefix = "REDIS_"
+        allow_mutation = False
         case_sensitive = True
+        env_prefix = "REDIS_"
 
     URL: AnyUrl
 
@@ -161,18 +166,53 @@ class SentrySettings(BaseSettings):
     """
 
     class Config:
-        env_prefix = "SENTRY_"
+        allow_mutation = False
         case_sensitive = True
+        env_prefix = "SENTRY_"
 
     DSN: str
     TRACES_SAMPLE_RATE: float
 
 
-# `.parse_obj()` thing is a workaround for pyright and pydantic interplay, see:
-# https://github.com/pydantic/pydantic/issues/3753#issuecomment-1087417884
-api = APISettings.parse_obj({})
-app = AppSettings.parse_obj({})
-db = DatabaseSettings.parse_obj({})
-openapi = OpenAPISettings.parse_obj({})
-redis = RedisSettings.parse_obj({})
-sentry = SentrySettings.parse_obj({})
+_SETTINGS_TYPES: dict[str, type[BaseSettings]] = {
+    "api": APISettings,
+    "app": AppSettings,
+    "db": DatabaseSettings,
+    "openapi": OpenAPISettings,
+    "redis": RedisSettings,
+    "sentry": SentrySettings,
+}
+
+api: APISettings
+app: AppSettings
+db: DatabaseSettings
+openapi: OpenAPISettings
+redis: RedisSettings
+sentry: SentrySettings
+
+
+def __getattr__(name: str) -> BaseSettings:
+    """Lazily build settings objects on first access (PEP 562).
+
+    Each settings object is constructed the first time it is accessed,
+    then cached in the module namespace, so consumers that don't touch
+    a settings group never pay for its validation at import time.
+
+    Args:
+        name: Name of the module attribute being accessed.
+
+    Returns:
+        The settings instance for `name`.
+
+    Raises:
+        AttributeError: If `name` is not one of the settings attributes.
+    """
+    try:
+        settings_type = _SETTINGS_TYPES[name]
+    except KeyError as exc:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from exc
+    # `.parse_obj()` thing is a workaround for pyright and pydantic interplay, see:
+    # https://github.com/pydantic/pydantic/issues/3753#issuecomment-1087417884
+    instance = settings_type.parse_obj({})
+    globals()[name] = instance
+    return instance
@@ -38,17 +38,27 @@ def mock_repo() -> SQLAlchemyRepository:
     return Repo(session=AsyncMock(spec=AsyncSession), select_=MagicMock())
 
 
-def test_wrap_sqlalchemy_integrity_error() -> None:
+async def test_wrap_sqlalchemy_integrity_error() -> None:
     """Test to ensure we wrap IntegrityError."""
-    with (pytest.raises(RepositoryConflictException), wrap_sqlalchemy_exception()):
+
+    @wrap_sqlalchemy_exception
+    async def raise_integrity_error() -> None:
         raise IntegrityError(None, None, Exception())
 
+    with pytest.raises(RepositoryConflictException):
+        await raise_integrity_error()
+
 
-def test_wrap_sqlalchemy_generic_error() -> None:
+async def test_wrap_sqlalchemy_generic_error() -> None:
     """Test to ensure we wrap generic SQLAlchemy exceptions."""
-    with (pytest.raises(RepositoryException), wrap_sqlalchemy_exception()):
+
+    @wrap_sqlalchemy_exception
+    async def raise_sqlalchemy_error() -> None:
         raise SQLAlchemyError
 
+    with pytest.raises(RepositoryException):
+        await raise_sqlalchemy_error()
+
 
 async def test_sqlalchemy_repo_add(mock_repo: SQLAlchemyRepository) -> None:
     """Test expected method calls for add operation."""
@@ -0,0 +1,77 @@
+"""Tests for the `httpx`-backed client."""
+# pylint: disable=protected-access
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from starlite_saqlalchemy import http
+
+if TYPE_CHECKING:
+    from pytest import MonkeyPatch
+
+
+@pytest.fixture(autouse=True)
+def _unset_client(monkeypatch: "MonkeyPatch") -> None:
+    """Ensure each test starts without a constructed client."""
+    monkeypatch.setattr(http.Client, "_client", None)
+
+
+async def test_client_constructed_on_first_use() -> None:
+    """Test the shared client is built lazily and reused."""
+    assert http.Client._client is None
+    client = http.Client._get_client()
+    try:
+        assert isinstance(client, httpx.AsyncClient)
+        assert http.Client._get_client() is client
+    finally:
+        await client.aclose()
+
+
+async def test_close_noop_when_client_never_constructed() -> None:
+    """Test `close()` doesn't construct a client just to close it."""
+    await http.Client.close()
+    assert http.Client._client is None
+
+
+async def test_close_closes_constructed_client(monkeypatch: "MonkeyPatch") -> None:
+    """Test `close()` closes the underlying client once constructed."""
+    aclose_mock = AsyncMock()
+    client = http.Client._get_client()
+    monkeypatch.setattr(client, "aclose", aclose_mock)
+    await http.Client.close()
+    aclose_mock.assert_awaited_once()
+
+
+def _patch_client_response(monkeypatch: "MonkeyPatch", status_code: int) -> httpx.Response:
+    """Patch the underlying client to return a response with `status_code`."""
+    response = httpx.Response(status_code, request=httpx.Request("GET", "http://localhost"))
+    client_mock = MagicMock(request=AsyncMock(return_value=response))
+    monkeypatch.setattr(http.Client, "_get_client", MagicMock(return_value=client_mock))
+    return response
+
+
+async def test_request_returns_successful_response(monkeypatch: "MonkeyPatch") -> None:
+    """Test `request()` returns the underlying client's 2xx response."""
+    response = _patch_client_response(monkeypatch, 200)
+    assert await http.Client().request("GET", "http://localhost") is response
+
+
+@pytest.mark.parametrize("status_code", [199, 301, 404, 500])
+async def test_request_non_success_status_raises(
+    status_code: int, monkeypatch: "MonkeyPatch"
+) -> None:
+    """Test `request()` raises `ClientException` for any non-2xx response."""
+    _patch_client_response(monkeypatch, status_code)
+    with pytest.raises(http.ClientException):
+        await http.Client().request("GET", "http://localhost")
+
+
+async def test_request_wraps_transport_error(monkeypatch: "MonkeyPatch") -> None:
+    """Test `request()` wraps `httpx` errors raised by the request itself."""
+    exc = httpx.ConnectError("borked", request=httpx.Request("GET", "http://localhost"))
+    client_mock = MagicMock(request=AsyncMock(side_effect=exc))
+    monkeypatch.setattr(http.Client, "_get_client", MagicMock(return_value=client_mock))
+    with pytest.raises(http.ClientException):
+        await http.Client().request("GET", "http://localhost")
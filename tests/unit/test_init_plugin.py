@@ -0,0 +1,35 @@
+"""Tests for the app config plugin and package import behavior."""
+# pylint: disable=protected-access
+import sys
+from unittest.mock import AsyncMock
+
+import pytest
+
+import starlite_saqlalchemy
+from starlite_saqlalchemy import http, init_plugin, redis
+
+
+def test_submodules_imported_on_first_access(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test package submodules are lazily imported and cached on the
+    package."""
+    monkeypatch.delattr(starlite_saqlalchemy, "orm", raising=False)
+    module = starlite_saqlalchemy.orm
+    assert module is sys.modules["starlite_saqlalchemy.orm"]
+    assert starlite_saqlalchemy.orm is module
+
+
+def test_unknown_package_attribute_raises() -> None:
+    """Test package access of a name that isn't a submodule."""
+    with pytest.raises(AttributeError):
+        _ = starlite_saqlalchemy.does_not_exist
+
+
+async def test_shutdown_resources_closes_both_clients(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the shutdown handler closes the HTTP and redis clients."""
+    http_close_mock = AsyncMock()
+    redis_close_mock = AsyncMock()
+    monkeypatch.setattr(http.Client, "close", http_close_mock)
+    monkeypatch.setattr(redis.client, "close", redis_close_mock)
+    await init_plugin._shutdown_resources()
+    http_close_mock.assert_awaited_once()
+    redis_close_mock.assert_awaited_once()
@@ -0,0 +1,21 @@
+"""Tests for lazy construction of the application settings."""
+import pytest
+
+from starlite_saqlalchemy import settings
+
+
+def test_settings_constructed_and_cached_on_first_access(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test settings objects are built on first attribute access and then
+    cached on the module."""
+    monkeypatch.delattr(settings, "app", raising=False)
+    instance = settings.app
+    assert isinstance(instance, settings.AppSettings)
+    assert settings.app is instance
+
+
+def test_unknown_settings_attribute_raises() -> None:
+    """Test module access of a name that isn't a settings object."""
+    with pytest.raises(AttributeError):
+        _ = settings.does_not_exist